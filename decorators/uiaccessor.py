@@ -6,6 +6,12 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+# Bind window accessor
+# This skips the module and class attribute lookups on every hotkey!
+#
+_getInstance = qskinblender.QSkinBlender.getInstance
+
+
 def uiAccessor(func):
     """
     Returns a wrapper that validates functions against the UI before executing.
@@ -21,7 +27,7 @@ def uiAccessor(func):
 
         # Check if window exists
         #
-        window = qskinblender.QSkinBlender.getInstance()
+        window = _getInstance()
 
         if window is not None:
 
@@ -150,15 +150,3 @@ def decrementWeights(window=None):
 
     amount = window.incrementWeightSpinBox.value()
     window.incrementWeights(-amount)
-
-
-@uiAccessor
-def pruneWeights(window=None):
-    """
-    Calls the prune vertices action from the main window.
-
-    :type window: qskinblender.QSkinBlender
-    :rtype: None
-    """
-
-    window.pruneWeights()
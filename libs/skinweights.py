@@ -16,7 +16,7 @@ class SkinWeights(psonobject.PSONObject):
     """
 
     # region Dunderscores
-    __slots__ = ('_name', '_influences', '_maxInfluences', '_weights', '_points')
+    __slots__ = ('_name', '_influences', '_maxInfluences', '_weights', '_usedInfluenceIds', '_points', '_pointTree')
 
     def __init__(self, *args, **kwargs):
         """
@@ -40,7 +40,9 @@ class SkinWeights(psonobject.PSONObject):
         self._influences = {}
         self._maxInfluences = 4
         self._weights = []
+        self._usedInfluenceIds = None
         self._points = []
+        self._pointTree = None
     # endregion
 
     # region Properties
@@ -130,6 +132,8 @@ class SkinWeights(psonobject.PSONObject):
         self._weights.clear()
         self._weights.extend([{stringutils.eval(influenceId): influenceWeight for (influenceId, influenceWeight) in influenceWeights.items()} for influenceWeights in weights])
 
+        self._usedInfluenceIds = None
+
     @property
     def points(self):
         """
@@ -151,9 +155,39 @@ class SkinWeights(psonobject.PSONObject):
 
         self._points.clear()
         self._points.extend(points)
+
+        self._pointTree = None
     # endregion
 
     # region Methods
+    def pointTree(self):
+        """
+        Returns the point tree used for closest point queries.
+        The tree is only rebuilt when the vertex points are changed!
+
+        :rtype: cKDTree
+        """
+
+        if self._pointTree is None:
+
+            self._pointTree = cKDTree(self.points)
+
+        return self._pointTree
+
+    def usedInfluenceIds(self):
+        """
+        Returns the sorted IDs of the influences that carry weights.
+        These are only recomputed when the skin weights are changed!
+
+        :rtype: Tuple[int]
+        """
+
+        if self._usedInfluenceIds is None:
+
+            self._usedInfluenceIds = tuple(sorted(set().union(*(weights.keys() for weights in self.weights))))
+
+        return self._usedInfluenceIds
+
     def remapInfluences(self, skin):
         """
         Returns an influence map for the supplied skin.
@@ -216,10 +250,20 @@ class SkinWeights(psonobject.PSONObject):
 
             influenceMap = self.remapInfluences(skin)
 
-        # Initialize point tree
+        # Query closest points
+        # The query is spread across all available cores since each point is independent!
+        # Older versions of scipy (pre 1.6) don't support the `workers` keyword so fallback on a serial query!
         #
-        tree = cKDTree(self.points)
-        distances, closestIndices = tree.query(skin.controlPoints())
+        tree = self.pointTree()
+        controlPoints = skin.controlPoints()
+
+        try:
+
+            distances, closestIndices = tree.query(controlPoints, workers=-1)
+
+        except TypeError:
+
+            distances, closestIndices = tree.query(controlPoints)
 
         # Apply weights
         #
@@ -0,0 +1,148 @@
+from dcc.vendor.Qt import QtCore, QtWidgets
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class QNoWheelComboBox(QtWidgets.QComboBox):
+    """
+    Overload of `QComboBox` that ignores scroll-wheel events.
+    """
+
+    # region Events
+    def wheelEvent(self, event):
+        """
+        Event method called after the mouse wheel has been rotated.
+        This is ignored to stop the scroll-wheel from messing up influences!
+
+        :type event: QtGui.QWheelEvent
+        :rtype: None
+        """
+
+        event.ignore()
+    # endregion
+
+
+class QComboBoxDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Overload of `QStyledItemDelegate` that displays and edits item indices through a combo box.
+    Combo boxes are only created for the cell currently being edited!
+    """
+
+    # region Dunderscores
+    def __init__(self, parent=None):
+        """
+        Private method called after a new instance has been created.
+
+        :type parent: QtCore.QObject
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(QComboBoxDelegate, self).__init__(parent)
+
+        # Declare private variables
+        # All editors share this model so items are only stored once!
+        #
+        self._itemModel = QtCore.QStringListModel(parent=self)
+    # endregion
+
+    # region Methods
+    def setItems(self, items):
+        """
+        Updates the combo box items.
+
+        :type items: List[str]
+        :rtype: None
+        """
+
+        self._itemModel.setStringList(list(items))
+
+    def displayText(self, value, locale):
+        """
+        Returns the string used to display the supplied item index.
+
+        :type value: Any
+        :type locale: QtCore.QLocale
+        :rtype: str
+        """
+
+        if isinstance(value, int):
+
+            text = self._itemModel.data(self._itemModel.index(value, 0), QtCore.Qt.DisplayRole)
+            return text if text is not None else ''
+
+        else:
+
+            return super(QComboBoxDelegate, self).displayText(value, locale)
+
+    def createEditor(self, parent, option, index):
+        """
+        Returns the widget used to edit the item specified by index for editing.
+
+        :type parent: QtWidgets.QWidget
+        :type option: QtWidgets.QStyleOptionViewItem
+        :type index: QtCore.QModelIndex
+        :rtype: QtWidgets.QWidget
+        """
+
+        comboBox = QNoWheelComboBox(parent=parent)
+        comboBox.setFocusPolicy(QtCore.Qt.ClickFocus)
+        comboBox.setModel(self._itemModel)
+        comboBox.currentIndexChanged.connect(self.on_comboBox_currentIndexChanged)
+
+        return comboBox
+
+    def setEditorData(self, editor, index):
+        """
+        Sets the data to be displayed and edited by the editor from the data model item specified by the model index.
+
+        :type editor: QtWidgets.QComboBox
+        :type index: QtCore.QModelIndex
+        :rtype: None
+        """
+
+        currentIndex = index.data(QtCore.Qt.EditRole)
+
+        editor.blockSignals(True)
+        editor.setCurrentIndex(currentIndex if isinstance(currentIndex, int) else -1)
+        editor.blockSignals(False)
+
+    def setModelData(self, editor, model, index):
+        """
+        Gets data from the editor widget and stores it in the specified model at the item index.
+
+        :type editor: QtWidgets.QComboBox
+        :type model: QtCore.QAbstractItemModel
+        :type index: QtCore.QModelIndex
+        :rtype: None
+        """
+
+        model.setData(index, editor.currentIndex(), QtCore.Qt.EditRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        """
+        Updates the editor for the item specified by index according to the style option given.
+
+        :type editor: QtWidgets.QComboBox
+        :type option: QtWidgets.QStyleOptionViewItem
+        :type index: QtCore.QModelIndex
+        :rtype: None
+        """
+
+        editor.setGeometry(option.rect)
+    # endregion
+
+    # region Slots
+    @QtCore.Slot(int)
+    def on_comboBox_currentIndexChanged(self, index):
+        """
+        Slot method for the `comboBox` widget's `currentIndexChanged` signal.
+
+        :type index: int
+        :rtype: None
+        """
+
+        self.commitData.emit(self.sender())
+    # endregion
@@ -1,6 +1,6 @@
 from abc import abstractmethod
+from collections import deque
 from dcc import fnskin, fnnode
-from dcc.python import stringutils
 from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
 from dcc.ui.dialogs import qmaindialog
 
@@ -10,12 +10,37 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+_icons = {}
+
+
+def getIcon(name):
+    """
+    Returns the cached icon with the specified name.
+    Icons are created on demand since a `QApplication` must exist beforehand!
+
+    :type name: str
+    :rtype: QtGui.QIcon
+    """
+
+    icon = _icons.get(name, None)
+
+    if icon is None:
+
+        icon = QtGui.QIcon(f':dcc/icons/{name}.png')
+        _icons[name] = icon
+
+    return icon
+
+
 class QEditInfluencesDialog(qmaindialog.QMainDialog):
     """
     Overload of `QMainDialog` that add/removes influence objects from a skin.
     """
 
     # region Dunderscores
+    FilterRole = QtCore.Qt.UserRole + 1
+    ValidRole = QtCore.Qt.UserRole + 2
+
     def __init__(self, *args, **kwargs):
         """
         Private method called after a new instance has been created.
@@ -34,14 +59,16 @@ class QEditInfluencesDialog(qmaindialog.QMainDialog):
         self._skin = fnskin.FnSkin()
         self._root = fnnode.FnNode()
         self._influences = {}
-        self._usedInfluenceIds = []
+        self._influenceIds = {}
+        self._usedInfluenceIds = set()
 
         # Declare public variables
         #
-        self.yesIcon = QtGui.QIcon(':dcc/icons/yes.png')
-        self.noIcon = QtGui.QIcon(':dcc/icons/no.png')
+        self.yesIcon = getIcon('yes')
+        self.noIcon = getIcon('no')
 
         self.filterLineEdit = None
+        self.filterTimer = None
         self.influenceTreeView = None
         self.influenceItemModel = None  # type: QtGui.QStandardItemModel
         self.influenceItemFilterModel = None  # type: QtCore.QSortFilterProxyModel
@@ -84,6 +111,12 @@ class QEditInfluencesDialog(qmaindialog.QMainDialog):
         self.filterLineEdit.setClearButtonEnabled(True)
         self.filterLineEdit.textChanged.connect(self.on_filterLineEdit_textChanged)
 
+        self.filterTimer = QtCore.QTimer(parent=self)
+        self.filterTimer.setObjectName('filterTimer')
+        self.filterTimer.setSingleShot(True)
+        self.filterTimer.setInterval(150)
+        self.filterTimer.timeout.connect(self.on_filterTimer_timeout)
+
         self.influenceTreeView = QtWidgets.QTreeView()
         self.influenceTreeView.setObjectName('influenceTreeView')
         self.influenceTreeView.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding))
@@ -95,7 +128,8 @@ class QEditInfluencesDialog(qmaindialog.QMainDialog):
         self.influenceTreeView.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.influenceTreeView.setRootIsDecorated(True)
         self.influenceTreeView.setUniformRowHeights(True)
-        self.influenceTreeView.setAnimated(True)
+        self.influenceTreeView.setSortingEnabled(False)
+        self.influenceTreeView.setAnimated(False)
         self.influenceTreeView.setHeaderHidden(True)
         self.influenceTreeView.expanded.connect(self.on_influenceTreeView_expanded)
         self.influenceTreeView.collapsed.connect(self.on_influenceTreeView_collapsed)
@@ -107,7 +141,8 @@ class QEditInfluencesDialog(qmaindialog.QMainDialog):
         self.influenceItemFilterModel = QtCore.QSortFilterProxyModel(parent=self.influenceTreeView)
         self.influenceItemFilterModel.setObjectName('influenceItemFilterModel')
         self.influenceItemFilterModel.setSourceModel(self.influenceItemModel)
-        self.influenceItemFilterModel.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.influenceItemFilterModel.setFilterRole(self.FilterRole)
+        self.influenceItemFilterModel.setFilterCaseSensitivity(QtCore.Qt.CaseSensitive)
         self.influenceItemFilterModel.setRecursiveFilteringEnabled(True)
 
         self.influenceTreeView.setModel(self.influenceItemFilterModel)
@@ -171,9 +206,8 @@ class QEditInfluencesDialog(qmaindialog.QMainDialog):
 
             self._root.setObject(self._skin.findRoot())
             self._influences = self._skin.influences()
-            self._usedInfluenceIds = self._skin.getUsedInfluenceIds()
-
-            self.invalidate()
+            self._influenceIds = self.mapInfluenceIds(self._influences)
+            self._usedInfluenceIds = set(self._skin.getUsedInfluenceIds())
 
     @property
     def root(self):
@@ -195,12 +229,22 @@ class QEditInfluencesDialog(qmaindialog.QMainDialog):
 
         return self._influences
 
+    @property
+    def influenceIds(self):
+        """
+        Getter method that returns the skin influence IDs keyed by their absolute names.
+
+        :rtype: Dict[str, int]
+        """
+
+        return self._influenceIds
+
     @property
     def usedInfluenceIds(self):
         """
         Getter method that returns the active influence IDs.
 
-        :rtype: List[int]
+        :rtype: Set[int]
         """
 
         return self._usedInfluenceIds
@@ -239,50 +283,94 @@ class QEditInfluencesDialog(qmaindialog.QMainDialog):
 
         pass
 
-    def appendInfluenceItem(self, influence, parentItem=None):
+    @staticmethod
+    def mapInfluenceIds(influences):
         """
-        Recursive method used to add all child joints to tree widget.
+        Returns a dictionary of influence IDs keyed by their absolute names.
+        This allows tree population to perform constant time membership tests!
 
-        :type influence: fnnode.FnNode
-        :type parentItem: QtGui.QStandardItem
-        :rtype: None
+        :type influences: Dict[int, Any]
+        :rtype: Dict[str, int]
         """
 
-        # Redundancy check
-        #
-        if influence is None:
+        node = fnnode.FnNode()
+        influenceIds = {}
 
-            return
+        for (influenceId, influence) in influences.items():
+
+            node.setObject(influence)
+            influenceIds[node.absoluteName()] = influenceId
+
+        return influenceIds
+
+    def createItem(self, influence):
+        """
+        Returns a new item for the supplied influence.
+
+        :type influence: fnnode.FnNode
+        :rtype: QtGui.QStandardItem
+        """
 
-        # Append row items
-        #
         isValid = self.isValidInfluence(influence)
         icon = self.yesIcon if isValid else self.noIcon
         name = influence.absoluteName()
-        whatsThis = name if isValid else ''
 
         item = QtGui.QStandardItem(icon, name)
-        item.setWhatsThis(whatsThis)
+        item.setData(isValid, role=self.ValidRole)
+        item.setData(self.influenceIds.get(name, None), role=QtCore.Qt.UserRole)
+        item.setData(name.lower(), role=self.FilterRole)
+
+        return item
+
+    def createInfluenceItem(self, influence):
+        """
+        Returns an item hierarchy for the supplied influence.
+        The returned item is not attached to a model so no signals are emitted while building!
 
-        parentItem.appendRow(item)
+        :type influence: fnnode.FnNode
+        :rtype: QtGui.QStandardItem
+        """
 
-        # Iterate through children
+        # Walk the joint hierarchy breadth-first
+        # Raw handles are queued so the same function sets can be reused for every joint!
         #
+        node = fnnode.FnNode()
         child = fnnode.FnNode()
 
-        for obj in influence.iterChildren():
+        rootItem = self.createItem(influence)
+        queue = deque([(influence.object(), rootItem)])
 
-            # Check if child is a joint
+        while len(queue) > 0:
+
+            # Create child items
             #
-            child.setObject(obj)
+            obj, parentItem = queue.popleft()
+            node.setObject(obj)
 
-            if child.isJoint():
+            childItems = []
 
-                self.appendInfluenceItem(child, parentItem=item)
+            for childObj in node.iterChildren():
 
-            else:
+                # Check if child is a joint
+                #
+                child.setObject(childObj)
 
-                continue
+                if not child.isJoint():
+
+                    continue
+
+                childItem = self.createItem(child)
+                childItems.append(childItem)
+
+                queue.append((childObj, childItem))
+
+            # Append child items in a single batch
+            #
+            if len(childItems) > 0:
+
+                parentItem.appendRows(childItems)
+
+        return rootItem
 
     def expandChildrenAtIndex(self, index):
         """
@@ -298,31 +386,37 @@ class QEditInfluencesDialog(qmaindialog.QMainDialog):
 
         if modifiers == QtCore.Qt.ShiftModifier:
 
-            # Get item from index
-            #
-            sourceIndex = self.influenceItemFilterModel.mapToSource(index)
-            item = self.influenceItemModel.itemFromIndex(sourceIndex)
-
-            # Iterate through children and set expanded
+            # Iterate through descendants and set expanded
+            # Signals are blocked so each child doesn't re-enter this method and trigger its own layout!
+            # Children are queried from the filter model directly since those are the indices the view expects!
             #
+            model = self.influenceItemFilterModel
             expanded = self.influenceTreeView.isExpanded(index)
-            rowCount = item.rowCount()
 
-            for i in range(rowCount):
+            self.influenceTreeView.setUpdatesEnabled(False)
+            self.influenceTreeView.blockSignals(True)
+
+            queue = deque([index])
+
+            while len(queue) > 0:
 
-                childItem = item.child(i, 0)
-                childIndex = self.influenceItemFilterModel.mapFromSource(childItem.index())
+                parentIndex = queue.popleft()
+                rowCount = model.rowCount(parentIndex)
 
-                self.influenceTreeView.setExpanded(childIndex, expanded)
+                for i in range(rowCount):
+
+                    childIndex = model.index(i, 0, parentIndex)
+
+                    self.influenceTreeView.setExpanded(childIndex, expanded)
+                    queue.append(childIndex)
+
+            self.influenceTreeView.blockSignals(False)
+            self.influenceTreeView.setUpdatesEnabled(True)
 
         else:
 
             log.debug('Shift is not pressed...')
 
-        # Resize column headers
-        #
-        self.influenceTreeView.resizeColumnToContents(0)
-
     def selectedInfluences(self, id=False):
         """
         Returns a list of the selected influence names.
@@ -332,19 +426,23 @@ class QEditInfluencesDialog(qmaindialog.QMainDialog):
         """
 
         # Get selected items
+        # The selection is mapped to the source model in one call rather than per index!
         #
-        selectedIndices = self.influenceTreeView.selectedIndexes()
+        selection = self.influenceTreeView.selectionModel().selection()
+        sourceSelection = self.influenceItemFilterModel.mapSelectionToSource(selection)
+
         influences = []
 
-        for (i, index) in enumerate(selectedIndices):
+        for index in sourceSelection.indexes():
 
             # Check if selected item is valid
             #
-            index = self.influenceItemFilterModel.mapToSource(index)
-            item = self.influenceItemModel.itemFromIndex(index)
-            whatsThis = item.whatsThis()
+            if index.column() != 0:
 
-            isValid = not stringutils.isNullOrEmpty(whatsThis)
+                continue
+
+            item = self.influenceItemModel.itemFromIndex(index)
+            isValid = item.data(role=self.ValidRole)
 
             if not isValid:
 
@@ -354,7 +452,7 @@ class QEditInfluencesDialog(qmaindialog.QMainDialog):
             #
             if id:
 
-                influences.append(self.influences.index(whatsThis))
+                influences.append(item.data(role=QtCore.Qt.UserRole))
 
             else:
 
@@ -370,16 +468,43 @@ class QEditInfluencesDialog(qmaindialog.QMainDialog):
         """
 
         # Check if skin and root are valid
+        # The item hierarchy is built detached and attached in one go to avoid per-row filtering and layouts!
         #
+        self.influenceTreeView.setUpdatesEnabled(False)
+        self.influenceTreeView.blockSignals(True)
+
         self.influenceItemModel.setRowCount(0)
 
         if self.skin.isValid() and self.root.isValid():
 
-            self.appendInfluenceItem(self.root, parentItem=self.influenceItemModel.invisibleRootItem())
+            rootItem = self.createInfluenceItem(self.root)
+            self.influenceItemModel.invisibleRootItem().appendRow(rootItem)
 
         else:
 
             log.debug('Unable to invalidate influence model!')
+
+        # Resize column headers
+        #
+        self.influenceTreeView.resizeColumnToContents(0)
+
+        self.influenceTreeView.blockSignals(False)
+        self.influenceTreeView.setUpdatesEnabled(True)
+
+    def exec_(self):
+        """
+        Shows the dialog as a modal dialog, blocking until the user closes it.
+
+        :rtype: QtWidgets.QDialog.DialogCode
+        """
+
+        # Invalidate user interface
+        #
+        self.invalidate()
+
+        # Call parent method
+        #
+        return super(QEditInfluencesDialog, self).exec_()
     # endregion
 
     # region Slots
@@ -392,8 +517,23 @@ class QEditInfluencesDialog(qmaindialog.QMainDialog):
         :rtype: None
         """
 
-        filterWildcard = '*{text}*'.format(text=text)
-        self.influenceItemFilterModel.setFilterWildcard(filterWildcard)
+        # Restart timer
+        # This coalesces rapid keystrokes into a single filter pass!
+        #
+        self.filterTimer.start()
+
+    @QtCore.Slot()
+    def on_filterTimer_timeout(self):
+        """
+        Slot method for the `filterTimer` widget's `timeout` signal.
+
+        :rtype: None
+        """
+
+        # Match against the pre-lowered names
+        # This spares the proxy from case folding every row during the filter pass!
+        #
+        self.influenceItemFilterModel.setFilterFixedString(self.textFilter.lower())
 
     @QtCore.Slot(QtCore.QModelIndex)
     def on_influenceTreeView_expanded(self, index):
@@ -450,7 +590,7 @@ class QAddInfluencesDialog(QEditInfluencesDialog):
         :rtype: bool
         """
 
-        return influence not in self.influences
+        return influence.absoluteName() not in self.influenceIds
     # endregion
 
     # region Slots
@@ -513,7 +653,7 @@ class QRemoveInfluencesDialog(QEditInfluencesDialog):
         :rtype: bool
         """
 
-        influenceId = self.influences.index(influence)
+        influenceId = self.influenceIds.get(influence.absoluteName(), None)
         return influenceId is not None and influenceId not in self.usedInfluenceIds
     # endregion
 
@@ -556,11 +696,11 @@ def addInfluences(skin, parent=None):
     """
 
     # Check if skin cluster is valid
+    # This is done before constructing the dialog to avoid building it for nothing!
     #
-    dialog = QAddInfluencesDialog(skin=skin, parent=parent)
-
-    if dialog.skin.isValid():
+    if fnskin.FnSkin().trySetObject(skin):
 
+        dialog = QAddInfluencesDialog(skin=skin, parent=parent)
         return dialog.exec_()
 
     else:
@@ -579,11 +719,11 @@ def removeInfluences(skin, parent=None):
     """
 
     # Check if skin cluster is valid
+    # This is done before constructing the dialog to avoid building it for nothing!
     #
-    dialog = QRemoveInfluencesDialog(skin=skin, parent=parent)
-
-    if dialog.skin.isValid():
+    if fnskin.FnSkin().trySetObject(skin):
 
+        dialog = QRemoveInfluencesDialog(skin=skin, parent=parent)
         return dialog.exec_()
 
     else:
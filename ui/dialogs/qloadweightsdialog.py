@@ -1,10 +1,11 @@
 import os
 
-from itertools import chain
 from dcc import fnskin, fnmesh
 from dcc.ui.dialogs import qmaindialog
 from dcc.vendor.six import string_types
-from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
+from dcc.vendor.Qt import QtCore, QtWidgets
+from ..models import qinfluencemapmodel
+from ..delegates import qcomboboxdelegate
 from ...libs import skinweights, skinutils
 
 import logging
@@ -37,12 +38,16 @@ class QLoadWeightsDialog(qmaindialog.QMainDialog):
         self._mesh = fnmesh.FnMesh()
         self._skin = fnskin.FnSkin()
         self._skinWeights = None
+        self._currentInfluenceIds = []
+        self._currentNameIndices = {}
 
         # Declare public variables
         #
         self.influenceLayout = None
         self.influenceGroupBox = None
-        self.influenceTableWidget = None
+        self.influenceTableView = None
+        self.influenceItemModel = None  # type: qinfluencemapmodel.QInfluenceMapModel
+        self.influenceItemDelegate = None  # type: qcomboboxdelegate.QComboBoxDelegate
 
         self.buttonsLayout = None
         self.buttonsWidget = None
@@ -88,29 +93,37 @@ class QLoadWeightsDialog(qmaindialog.QMainDialog):
         self.influenceGroupBox.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding))
         self.influenceGroupBox.setLayout(self.influenceLayout)
 
-        self.influenceTableWidget = QtWidgets.QTableWidget()
-        self.influenceTableWidget.setObjectName('influenceTableWidget')
-        self.influenceTableWidget.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred))
-        self.influenceTableWidget.setStyleSheet('QTableWidget:item { height: 24; }')
-        self.influenceTableWidget.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
-        self.influenceTableWidget.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
-        self.influenceTableWidget.setAlternatingRowColors(True)
-        self.influenceTableWidget.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
-        self.influenceTableWidget.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.influenceTableWidget.setColumnCount(2)
-        self.influenceTableWidget.setHorizontalHeaderLabels(['Joint', 'Current'])
-
-        horizontalHeader = self.influenceTableWidget.horizontalHeader()  # type: QtWidgets.QHeaderView
+        self.influenceTableView = QtWidgets.QTableView()
+        self.influenceTableView.setObjectName('influenceTableView')
+        self.influenceTableView.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred))
+        self.influenceTableView.setStyleSheet('QTableView:item { height: 24; }')
+        self.influenceTableView.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.influenceTableView.setEditTriggers(QtWidgets.QAbstractItemView.CurrentChanged | QtWidgets.QAbstractItemView.SelectedClicked | QtWidgets.QAbstractItemView.DoubleClicked)
+        self.influenceTableView.setAlternatingRowColors(True)
+        self.influenceTableView.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.influenceTableView.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+
+        self.influenceItemModel = qinfluencemapmodel.QInfluenceMapModel(parent=self.influenceTableView)
+        self.influenceItemModel.setObjectName('influenceItemModel')
+
+        self.influenceItemDelegate = qcomboboxdelegate.QComboBoxDelegate(parent=self.influenceTableView)
+        self.influenceItemDelegate.setObjectName('influenceItemDelegate')
+
+        self.influenceTableView.setModel(self.influenceItemModel)
+        self.influenceTableView.setItemDelegateForColumn(1, self.influenceItemDelegate)
+
+        horizontalHeader = self.influenceTableView.horizontalHeader()  # type: QtWidgets.QHeaderView
         horizontalHeader.setStretchLastSection(True)
         horizontalHeader.setMinimumSectionSize(50)
         horizontalHeader.setDefaultSectionSize(100)
+        horizontalHeader.setSectionResizeMode(QtWidgets.QHeaderView.Stretch)
 
-        verticalHeader = self.influenceTableWidget.verticalHeader()  # type: QtWidgets.QHeaderView
+        verticalHeader = self.influenceTableView.verticalHeader()  # type: QtWidgets.QHeaderView
         verticalHeader.setStretchLastSection(False)
         verticalHeader.setMinimumSectionSize(24)
         verticalHeader.setDefaultSectionSize(24)
 
-        self.influenceLayout.addWidget(self.influenceTableWidget)
+        self.influenceLayout.addWidget(self.influenceTableView)
 
         centralLayout.addWidget(self.influenceGroupBox)
 
@@ -229,26 +242,6 @@ class QLoadWeightsDialog(qmaindialog.QMainDialog):
         self._skinWeights = skinWeights
     # endregion
 
-    # region Events
-    def eventFilter(self, watched, event):
-        """
-        Filters events if this object has been installed as an event filter for the watched object.
-        In your reimplementation of this function, if you want to filter the event out, i.e. stop it being handled further, return true; otherwise return false.
-
-        :type watched: QtCore.QObject
-        :type event: QtCore.QEvent
-        :rtype bool
-        """
-
-        if isinstance(watched, QtWidgets.QComboBox) and isinstance(event, QtGui.QWheelEvent):
-
-            return True  # This blocks the scroll-wheel from messing up influences!
-
-        else:
-
-            return False
-    # endregion
-
     # region Methods
     @classmethod
     def isSkeletalMesh(cls, mesh):
@@ -441,35 +434,28 @@ class QLoadWeightsDialog(qmaindialog.QMainDialog):
 
         # Iterate through rows
         #
-        numRows = self.influenceTableWidget.rowCount()
-
-        for row in range(numRows):
-
-            # Check if row is hidden
-            #
-            if self.influenceTableWidget.isRowHidden(row):
+        incomingNames = self.influenceItemModel.incomingNames()
+        currentIndices = list(self.influenceItemModel.currentIndices())
 
-                log.debug('Skipping row index: %s' % row)
-                continue
+        for (row, influenceName) in enumerate(incomingNames):
 
-            # Get selected combo box item
+            # Find matching name from current influences
             #
-            tableItem = self.influenceTableWidget.item(row, 0)
-            influenceName = tableItem.text()
-
-            # Find matching text value from influence table
-            #
-            comboBox = self.influenceTableWidget.cellWidget(row, 1)
-            index = comboBox.findText(influenceName)
+            index = self._currentNameIndices.get(influenceName, -1)
 
             if index != -1:
 
-                comboBox.setCurrentIndex(index)
+                currentIndices[row] = index
 
             else:
 
                 log.warning('Unable to find a match for influence: %s!' % influenceName)
 
+        # Update item model
+        # This is done in a single pass so views are only notified once!
+        #
+        self.influenceItemModel.setCurrentIndices(currentIndices)
+
     def selectedMethod(self):
         """
         Returns the user specified load operation:
@@ -487,17 +473,14 @@ class QLoadWeightsDialog(qmaindialog.QMainDialog):
         """
 
         # Evaluate selected method
+        # The button group IDs double as indices into the available methods!
         #
-        influenceMap = self.influenceMap()
+        methods = (self.skinWeights.applyWeights, self.skinWeights.applyClosestWeights)
         method = self.selectedMethod()
 
-        if method == 0:
-
-            return self.skinWeights.applyWeights(self.skin, influenceMap=influenceMap)
+        if 0 <= method < len(methods):
 
-        elif method == 1:
-
-            return self.skinWeights.applyClosestWeights(self.skin, influenceMap=influenceMap)
+            return methods[method](self.skin, influenceMap=self.influenceMap())
 
         else:
 
@@ -512,15 +495,12 @@ class QLoadWeightsDialog(qmaindialog.QMainDialog):
 
         # Iterate through rows
         #
-        influenceMap = {}
-        influenceIds = list(self.skin.influences().keys())
-
-        numRows = self.influenceTableWidget.rowCount()
+        influenceIds = self._currentInfluenceIds
 
-        for i in range(numRows):
+        incomingIds = self.influenceItemModel.incomingIds()
+        currentIndices = self.influenceItemModel.currentIndices()
 
-            comboBox = self.influenceTableWidget.cellWidget(i, 1)
-            influenceMap[i] = influenceIds[comboBox.currentIndex()]
+        influenceMap = {incomingId: influenceIds[currentIndex] for (incomingId, currentIndex) in zip(incomingIds, currentIndices)}
 
         # Return influence map
         #
@@ -529,7 +509,7 @@ class QLoadWeightsDialog(qmaindialog.QMainDialog):
 
     def invalidate(self):
         """
-        Repopulates the influence table widget items.
+        Repopulates the influence item model.
 
         :rtype: None
         """
@@ -544,50 +524,28 @@ class QLoadWeightsDialog(qmaindialog.QMainDialog):
 
             return
 
-        # Update row count
-        #
-        maxInfluenceId = max(self.skinWeights.influences.keys())
-        rowCount = maxInfluenceId + 1
-
-        self.influenceTableWidget.clearContents()
-        self.influenceTableWidget.setRowCount(rowCount)
-        self.influenceTableWidget.setVerticalHeaderLabels(list(map(str, range(rowCount))))
-
-        # Iterate through influences
+        # Collect influence names
+        # Only influences that carry weights are listed since the remainder can never be remapped!
         #
         currentInfluences = self.skin.influenceNames()
         incomingInfluences = self.skinWeights.influences
 
-        usedInfluenceIds = set(chain(*[weights.keys() for weights in self.skinWeights.weights]))
-
-        for influenceId in range(rowCount):
-
-            # Create weighted influence item
-            #
-            influenceName = incomingInfluences.get(influenceId, '')
-            tableItem = QtWidgets.QTableWidgetItem(influenceName)
-
-            # Create remap combo box
-            #
-            comboBox = QtWidgets.QComboBox(parent=self.influenceTableWidget)
-            comboBox.setFocusPolicy(QtCore.Qt.ClickFocus)
-            comboBox.addItems(list(currentInfluences.values()))
-            comboBox.installEventFilter(self)
+        currentNames = list(currentInfluences.values())
+        self._currentInfluenceIds = list(currentInfluences.keys())
+        self._currentNameIndices = {}
 
-            # Assign items to table
-            #
-            self.influenceTableWidget.setItem(influenceId, 0, tableItem)
-            self.influenceTableWidget.setCellWidget(influenceId, 1, comboBox)
+        for (i, currentName) in enumerate(currentNames):
 
-            # Check if row should be hidden
-            #
-            if influenceId not in usedInfluenceIds:
+            self._currentNameIndices.setdefault(currentName, i)
 
-                self.influenceTableWidget.setRowHidden(influenceId, True)
+        usedInfluenceIds = self.skinWeights.usedInfluenceIds()
+        incomingNames = [incomingInfluences.get(influenceId, '') for influenceId in usedInfluenceIds]
 
-        # Resize items to contents
+        # Update item model and delegate
+        # Combo boxes are only created by the delegate when a cell is edited!
         #
-        self.influenceTableWidget.resizeColumnsToContents()
+        self.influenceItemDelegate.setItems(currentNames)
+        self.influenceItemModel.setInfluences(usedInfluenceIds, incomingNames)
 
         # Try and match influences by name
         #
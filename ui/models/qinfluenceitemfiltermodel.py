@@ -1,9 +1,10 @@
+from itertools import repeat
+from operator import methodcaller
 from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
+from .qinfluenceitemmodel import QInfluenceItemModel
 
 import logging
-logging.basicConfig()
 log = logging.getLogger(__name__)
-log.setLevel(logging.INFO)
 
 
 class QInfluenceItemFilterModel(QtCore.QSortFilterProxyModel):
@@ -26,7 +27,31 @@ class QInfluenceItemFilterModel(QtCore.QSortFilterProxyModel):
 
         # Declare private variables
         #
-        self._overrides = []
+        self._overrides = set()
+        self._sourceModel = None
+        self._activeInfluences = None
+        self._hasFilterPattern = False
+        self._selectedRows = None
+        self._forceAcceptRows = frozenset()
+
+        # Connect signals
+        # Any change to the proxy rows means the active influences have to be recomputed!
+        #
+        self.layoutChanged.connect(self.clearActiveInfluences)
+        self.modelReset.connect(self.clearActiveInfluences)
+        self.rowsInserted.connect(self.clearActiveInfluences)
+        self.rowsRemoved.connect(self.clearActiveInfluences)
+
+        # Match patterns against the influence names
+        # This keeps the wildcard matching inside Qt rather than the display text!
+        #
+        self.setFilterRole(QInfluenceItemModel.NameRole)
+        self.setFilterKeyColumn(0)
+
+        # Enable dynamic filtering
+        # Renamed rows are re-filtered as their names change so the source models don't require a full invalidation!
+        #
+        self.setDynamicSortFilter(True)
     # endregion
 
     # region Properties
@@ -34,16 +59,18 @@ class QInfluenceItemFilterModel(QtCore.QSortFilterProxyModel):
     def overrides(self):
         """
         Getter method that returns a list of exempt influence IDs.
+        Overrides only apply to the filter pass started by the setter, so this is empty once that pass has completed!
 
         :rtype: list[int]
         """
 
-        return self._overrides
+        return list(self._overrides)
 
     @overrides.setter
     def overrides(self, overrides):
         """
         Setter method that updates the list of visible influence IDs.
+        Any hidden influences are shown for a single filter pass, after which the overrides are cleared!
 
         :type overrides: list[int]
         :rtype: None
@@ -51,14 +78,27 @@ class QInfluenceItemFilterModel(QtCore.QSortFilterProxyModel):
 
         # Check argument types
         #
-        if not all([isinstance(x, int) for x in overrides]):
+        if not all(isinstance(x, int) for x in overrides):
 
             raise TypeError('overrides.setter() expects a sequence of integers!')
 
+        # Check if any overrides are hidden
+        # Overrides are stored as a set since they're tested against every filtered row!
+        #
+        self._overrides = set(overrides).difference(self.activeInfluences())
+
+        if len(self._overrides) == 0:
+
+            return
+
         # Invalidate filter
+        # Overrides only apply to a single pass so they're cleared once the pass has completed!
         #
-        self._overrides = list(overrides)
+        self._selectedRows = None
         self.invalidateFilter()
+
+        self._overrides.clear()
+        self._selectedRows = None
     # endregion
 
     # region Methods
@@ -70,7 +110,11 @@ class QInfluenceItemFilterModel(QtCore.QSortFilterProxyModel):
         :rtype: bool
         """
 
-        if value is None:
+        if isinstance(value, str):
+
+            return not value
+
+        elif value is None:
 
             return True
 
@@ -86,14 +130,121 @@ class QInfluenceItemFilterModel(QtCore.QSortFilterProxyModel):
 
             return False
 
+    def setSourceModel(self, sourceModel):
+        """
+        Sets the given source model to be processed by the proxy model.
+        The source model is cached here so filtering doesn't have to look it up per row!
+
+        :type sourceModel: QInfluenceItemModel
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(QInfluenceItemFilterModel, self).setSourceModel(sourceModel)
+
+        # Cache source model
+        #
+        self._sourceModel = sourceModel
+
+    def forceAcceptRows(self):
+        """
+        Returns the rows that are always accepted, regardless of the filter.
+        This combines the selected rows and overrides so filtering only requires a single lookup per row!
+
+        :rtype: FrozenSet[int]
+        """
+
+        # Check if selection has changed
+        # The view replaces its selected row set whenever the selection changes!
+        #
+        selectedRows = self.parent().selectedRowSet()
+
+        if selectedRows is not self._selectedRows:
+
+            self._selectedRows = selectedRows
+            self._forceAcceptRows = selectedRows.union(self._overrides)
+
+        return self._forceAcceptRows
+
+    def isNullOrEmptyPattern(self, pattern):
+        """
+        Evaluates if the supplied filter pattern is null or empty.
+
+        :type pattern: Union[str, QtCore.QRegularExpression]
+        :rtype: bool
+        """
+
+        if isinstance(pattern, QtCore.QRegularExpression):
+
+            return self.isNullOrEmpty(pattern.pattern())
+
+        else:
+
+            return self.isNullOrEmpty(pattern)
+
+    def setFilterRegularExpression(self, pattern):
+        """
+        Sets the regular expression used to filter the contents of the source model.
+        The pattern flag is updated beforehand since the parent method filters synchronously!
+
+        :type pattern: Union[str, QtCore.QRegularExpression]
+        :rtype: None
+        """
+
+        self._hasFilterPattern = not self.isNullOrEmptyPattern(pattern)
+        super(QInfluenceItemFilterModel, self).setFilterRegularExpression(pattern)
+
+    def setFilterFixedString(self, pattern):
+        """
+        Sets the fixed string used to filter the contents of the source model.
+        The pattern flag is updated beforehand since the parent method filters synchronously!
+
+        :type pattern: str
+        :rtype: None
+        """
+
+        self._hasFilterPattern = not self.isNullOrEmptyPattern(pattern)
+        super(QInfluenceItemFilterModel, self).setFilterFixedString(pattern)
+
+    def setFilterWildcard(self, pattern):
+        """
+        Sets the wildcard expression used to filter the contents of the source model.
+        The pattern flag is updated beforehand since the parent method filters synchronously!
+
+        :type pattern: str
+        :rtype: None
+        """
+
+        self._hasFilterPattern = not self.isNullOrEmptyPattern(pattern)
+        super(QInfluenceItemFilterModel, self).setFilterWildcard(pattern)
+
     def activeInfluences(self):
         """
         Returns a list of active influences.
+        This list is cached between filter passes so it should not be modified!
 
         :rtype: list[int]
         """
 
-        return [self.mapToSource(self.index(x, 0)).row() for x in range(self.rowCount())]
+        if self._activeInfluences is None:
+
+            # Map proxy rows to source rows
+            # The bound methods are passed straight to map so the loop stays in C!
+            #
+            indices = map(self.index, range(self.rowCount()), repeat(0))
+            self._activeInfluences = list(map(methodcaller('row'), map(self.mapToSource, indices)))
+
+        return self._activeInfluences
+
+    def clearActiveInfluences(self, *args):
+        """
+        Clears the cached active influences.
+
+        :rtype: None
+        """
+
+        self._activeInfluences = None
 
     def activeInfluenceCount(self):
         """
@@ -111,7 +262,10 @@ class QInfluenceItemFilterModel(QtCore.QSortFilterProxyModel):
         :rtype: list[int]
         """
 
-        return list(set(range(self.sourceModel().rowCount())).difference(set(self.activeInfluences())))
+        activeInfluences = set(self.activeInfluences())
+        rowCount = self._sourceModel.rowCount()
+
+        return [row for row in range(rowCount) if row not in activeInfluences]
 
     def inactiveInfluenceCount(self):
         """
@@ -120,7 +274,17 @@ class QInfluenceItemFilterModel(QtCore.QSortFilterProxyModel):
         :rtype: int
         """
 
-        return len(self.inactiveInfluences())
+        return self._sourceModel.rowCount() - self.activeInfluenceCount()
+
+    def invalidateFilter(self):
+        """
+        Invalidates the current filtering.
+
+        :rtype: None
+        """
+
+        self.clearActiveInfluences()
+        super(QInfluenceItemFilterModel, self).invalidateFilter()
 
     def filterAcceptsRow(self, row, parent):
         """
@@ -131,37 +295,28 @@ class QInfluenceItemFilterModel(QtCore.QSortFilterProxyModel):
         :rtype: bool
         """
 
-        # Evaluate row for null items
-        #
-        sourceModel = self.sourceModel()
-        columnCount = sourceModel.columnCount()
-        indices = [sourceModel.index(row, column, parent=parent) for column in range(columnCount)]
-
-        isNull = any(self.isNullOrEmpty(sourceModel.itemFromIndex(index).text()) for index in indices)
-
-        # Call parent method
-        # This will evaluate any regex expressions
+        # Evaluate row for selected items and overrides
         #
-        acceptsRow = super(QInfluenceItemFilterModel, self).filterAcceptsRow(row, parent)
-        selectedRows = self.parent().selectedRows()
-
-        if (acceptsRow and not isNull) or (row in selectedRows):
+        if row in self.forceAcceptRows():
 
-            log.debug(f'Accepting row: {row}')
+            log.debug('Accepting row: %s', row)
             return True
 
-        elif row in self._overrides:
-
-            log.debug(f'Overriding row: {row}')
-            self._overrides.remove(row)
+        # Evaluate row for null items
+        # The source model caches its null rows so this doesn't have to inspect every column!
+        #
+        if row in self._sourceModel.nullRows():
 
-            return True
+            return False
 
-        elif isNull:
+        # Call parent method
+        # This will evaluate any regex expressions, so it's skipped when there's no pattern to match!
+        #
+        if self._hasFilterPattern:
 
-            return False
+            return super(QInfluenceItemFilterModel, self).filterAcceptsRow(row, parent)
 
         else:
 
-            return acceptsRow
+            return True
     # endregion
@@ -0,0 +1,188 @@
+from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class QInfluenceItemModel(QtCore.QAbstractTableModel):
+    """
+    Overload of `QAbstractTableModel` that displays skin influence names.
+    Names are stored in a plain tuple so repopulating the model doesn't allocate any items.
+    """
+
+    # region Dunderscores
+    __headers__ = ('Name',)
+
+    NameRole = QtCore.Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        """
+        Private method called after a new instance has been created.
+
+        :type parent: QtCore.QObject
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(QInfluenceItemModel, self).__init__(parent)
+
+        # Declare private variables
+        #
+        self._names = ()
+        self._nullRows = None
+        self._sizeHint = QtCore.QSize(72, 24)
+    # endregion
+
+    # region Methods
+    def nullRows(self):
+        """
+        Returns the rows that contain an empty item.
+        These are cached until the model data changes so filtering only requires a set lookup per row!
+
+        :rtype: FrozenSet[int]
+        """
+
+        if self._nullRows is None:
+
+            self._nullRows = frozenset(row for (row, name) in enumerate(self._names) if not name)
+
+        return self._nullRows
+
+    def setNames(self, names):
+        """
+        Updates the influence names.
+        Names are stored as an immutable tuple so the same instance can be shared between models!
+
+        :type names: Sequence[str]
+        :rtype: None
+        """
+
+        # Resize internal tuple
+        # Null rows are cleared up front since inserting rows will trigger the proxy filters!
+        #
+        names = tuple(names)
+
+        if names == self._names:
+
+            return
+
+        self._nullRows = None
+
+        oldNames = self._names
+        oldCount = len(oldNames)
+        newCount = len(names)
+
+        if newCount > oldCount:
+
+            self.beginInsertRows(QtCore.QModelIndex(), oldCount, newCount - 1)
+            self._names = names
+            self.endInsertRows()
+
+        elif newCount < oldCount:
+
+            self.beginRemoveRows(QtCore.QModelIndex(), newCount, oldCount - 1)
+            self._names = names
+            self.endRemoveRows()
+
+        else:
+
+            self._names = names
+
+        # Update existing rows
+        # Existing rows are updated in place so any view selections are preserved!
+        # Only the span of renamed rows is signalled so unchanged rows aren't re-filtered!
+        #
+        commonCount = min(oldCount, newCount)
+        rows = [row for row in range(commonCount) if oldNames[row] != names[row]]
+
+        if len(rows) > 0:
+
+            topLeft = self.index(rows[0], 0)
+            bottomRight = self.index(rows[-1], self.columnCount() - 1)
+
+            self.dataChanged.emit(topLeft, bottomRight, [QtCore.Qt.DisplayRole, self.NameRole])
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """
+        Returns the number of rows under the given parent.
+
+        :type parent: QtCore.QModelIndex
+        :rtype: int
+        """
+
+        if parent.isValid():
+
+            return 0
+
+        else:
+
+            return len(self._names)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """
+        Returns the number of columns under the given parent.
+
+        :type parent: QtCore.QModelIndex
+        :rtype: int
+        """
+
+        if parent.isValid():
+
+            return 0
+
+        else:
+
+            return len(self.__headers__)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """
+        Returns the data stored under the given role for the item referred to by the index.
+
+        :type index: QtCore.QModelIndex
+        :type role: int
+        :rtype: Any
+        """
+
+        if not index.isValid():
+
+            return None
+
+        elif role == QtCore.Qt.DisplayRole or role == self.NameRole:
+
+            return self._names[index.row()]
+
+        elif role == QtCore.Qt.TextAlignmentRole:
+
+            return int(QtCore.Qt.AlignCenter)
+
+        elif role == QtCore.Qt.SizeHintRole:
+
+            return self._sizeHint
+
+        else:
+
+            return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        """
+        Returns the data for the given role and section in the header with the specified orientation.
+
+        :type section: int
+        :type orientation: QtCore.Qt.Orientation
+        :type role: int
+        :rtype: Any
+        """
+
+        if role != QtCore.Qt.DisplayRole:
+
+            return None
+
+        elif orientation == QtCore.Qt.Horizontal:
+
+            return self.__headers__[section]
+
+        else:
+
+            return str(section)
+    # endregion
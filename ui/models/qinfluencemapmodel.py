@@ -0,0 +1,221 @@
+from dcc.vendor.Qt import QtCore
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class QInfluenceMapModel(QtCore.QAbstractTableModel):
+    """
+    Overload of `QAbstractTableModel` that remaps incoming influences onto the current skin influences.
+    Each row stores the index of its current influence so no widgets are required per row!
+    The current influence names are owned by the delegate responsible for displaying and editing these indices!
+    """
+
+    # region Dunderscores
+    __headers__ = ('Joint', 'Current')
+
+    def __init__(self, parent=None):
+        """
+        Private method called after a new instance has been created.
+
+        :type parent: QtCore.QObject
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(QInfluenceMapModel, self).__init__(parent)
+
+        # Declare private variables
+        #
+        self._incomingIds = []
+        self._incomingNames = []
+        self._currentIndices = []
+    # endregion
+
+    # region Methods
+    def incomingIds(self):
+        """
+        Returns the incoming influence IDs.
+
+        :rtype: List[int]
+        """
+
+        return self._incomingIds
+
+    def incomingNames(self):
+        """
+        Returns the incoming influence names.
+
+        :rtype: List[str]
+        """
+
+        return self._incomingNames
+
+    def currentIndices(self):
+        """
+        Returns the current influence index for each incoming influence.
+
+        :rtype: List[int]
+        """
+
+        return self._currentIndices
+
+    def setInfluences(self, incomingIds, incomingNames):
+        """
+        Resets the incoming influences.
+
+        :type incomingIds: List[int]
+        :type incomingNames: List[str]
+        :rtype: None
+        """
+
+        self.beginResetModel()
+
+        self._incomingIds = list(incomingIds)
+        self._incomingNames = list(incomingNames)
+        self._currentIndices = [0] * len(self._incomingNames)
+
+        self.endResetModel()
+
+    def setCurrentIndices(self, indices):
+        """
+        Updates the current influence index for every row.
+
+        :type indices: List[int]
+        :rtype: None
+        """
+
+        # Update internal indices
+        #
+        self._currentIndices = list(indices)
+
+        # Notify views of changes
+        #
+        rowCount = self.rowCount()
+
+        if rowCount > 0:
+
+            topLeft = self.index(0, 1)
+            bottomRight = self.index(rowCount - 1, 1)
+
+            self.dataChanged.emit(topLeft, bottomRight, [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole])
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """
+        Returns the number of rows under the given parent.
+
+        :type parent: QtCore.QModelIndex
+        :rtype: int
+        """
+
+        if parent.isValid():
+
+            return 0
+
+        else:
+
+            return len(self._incomingNames)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        """
+        Returns the number of columns under the given parent.
+
+        :type parent: QtCore.QModelIndex
+        :rtype: int
+        """
+
+        if parent.isValid():
+
+            return 0
+
+        else:
+
+            return len(self.__headers__)
+
+    def flags(self, index):
+        """
+        Returns the item flags for the given index.
+
+        :type index: QtCore.QModelIndex
+        :rtype: QtCore.Qt.ItemFlags
+        """
+
+        flags = super(QInfluenceMapModel, self).flags(index)
+
+        if index.isValid() and index.column() == 1:
+
+            return flags | QtCore.Qt.ItemIsEditable
+
+        else:
+
+            return flags
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """
+        Returns the data stored under the given role for the item referred to by the index.
+
+        :type index: QtCore.QModelIndex
+        :type role: int
+        :rtype: Any
+        """
+
+        if not index.isValid():
+
+            return None
+
+        row, column = index.row(), index.column()
+
+        if column == 0 and role == QtCore.Qt.DisplayRole:
+
+            return self._incomingNames[row]
+
+        elif column == 1 and (role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole):
+
+            return self._currentIndices[row]
+
+        else:
+
+            return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        """
+        Sets the role data for the item at the given index.
+
+        :type index: QtCore.QModelIndex
+        :type value: Any
+        :type role: int
+        :rtype: bool
+        """
+
+        if not (index.isValid() and index.column() == 1 and role == QtCore.Qt.EditRole):
+
+            return False
+
+        self._currentIndices[index.row()] = int(value)
+        self.dataChanged.emit(index, index, [QtCore.Qt.DisplayRole, QtCore.Qt.EditRole])
+
+        return True
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        """
+        Returns the data for the given role and section in the header with the specified orientation.
+
+        :type section: int
+        :type orientation: QtCore.Qt.Orientation
+        :type role: int
+        :rtype: Any
+        """
+
+        if role != QtCore.Qt.DisplayRole:
+
+            return None
+
+        elif orientation == QtCore.Qt.Horizontal:
+
+            return self.__headers__[section]
+
+        else:
+
+            return str(self._incomingIds[section])
+    # endregion
@@ -0,0 +1,95 @@
+from dcc.vendor.Qt import QtCore, QtWidgets, QtGui
+from . import qinfluenceitemmodel
+
+import logging
+log = logging.getLogger(__name__)
+
+
+class QWeightItemModel(qinfluenceitemmodel.QInfluenceItemModel):
+    """
+    Overload of `QInfluenceItemModel` that displays skin influence names alongside their weights.
+    """
+
+    # region Dunderscores
+    __headers__ = ('Name', 'Weight')
+
+    def __init__(self, parent=None):
+        """
+        Private method called after a new instance has been created.
+
+        :type parent: QtCore.QObject
+        :rtype: None
+        """
+
+        # Call parent method
+        #
+        super(QWeightItemModel, self).__init__(parent)
+
+        # Declare private variables
+        #
+        self._texts = {}
+    # endregion
+
+    # region Methods
+    def nullRows(self):
+        """
+        Returns the rows that contain an empty item.
+        Any influence without a weight is considered empty!
+
+        :rtype: FrozenSet[int]
+        """
+
+        if self._nullRows is None:
+
+            self._nullRows = frozenset(row for (row, name) in enumerate(self._names) if not name or row not in self._texts)
+
+        return self._nullRows
+
+    def setWeights(self, weights):
+        """
+        Updates the influence weights.
+
+        :type weights: Dict[int, float]
+        :rtype: None
+        """
+
+        # Update internal weights
+        # The display text is formatted up front so painting only has to perform a lookup!
+        #
+        oldTexts = self._texts
+
+        self._texts = {index: str(round(weight, 2)) for (index, weight) in weights.items()}
+        self._nullRows = None
+
+        # Collect the rows that are affected
+        # Only previously and newly weighted influences whose display text differs have changed!
+        #
+        rowCount = self.rowCount()
+        rows = [row for row in set(oldTexts).union(self._texts) if 0 <= row < rowCount and oldTexts.get(row) != self._texts.get(row)]
+
+        # Notify views of changes
+        #
+        if len(rows) > 0:
+
+            topLeft = self.index(min(rows), 1)
+            bottomRight = self.index(max(rows), 1)
+
+            self.dataChanged.emit(topLeft, bottomRight, [QtCore.Qt.DisplayRole])
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """
+        Returns the data stored under the given role for the item referred to by the index.
+
+        :type index: QtCore.QModelIndex
+        :type role: int
+        :rtype: Any
+        """
+
+        if index.isValid() and index.column() == 1 and role == QtCore.Qt.DisplayRole:
+
+            return self._texts.get(index.row(), '')
+
+        else:
+
+            return super(QWeightItemModel, self).data(index, role=role)
+    # endregion
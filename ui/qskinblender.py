@@ -2,11 +2,11 @@ import os
 import webbrowser
 
 from dcc import fnscene, fnnode, fnmesh, fnskin, fnnotify
-from dcc.vendor.Qt import QtCore, QtWidgets, QtGui, QtCompat
+from dcc.vendor.Qt import QtCore, QtWidgets, QtCompat
 from dcc.ui import qsingletonwindow, qdropdownbutton, qpersistentmenu
 from dcc.math import skinmath
 from .dialogs import qeditinfluencesdialog, qloadweightsdialog
-from .models import qinfluenceitemfiltermodel
+from .models import qinfluenceitemmodel, qweightitemmodel, qinfluenceitemfiltermodel
 from .views import qinfluenceview
 from ..libs import skinutils
 from ..decorators.contextguard import contextGuard
@@ -103,6 +103,8 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
         self._vertexWeights = {}
         self._weights = {}
         self._search = ''
+        self._searchRegex = None
+        self._lastSearch = ''
         self._mirrorTolerance = 1e-3
         self._clipboard = None
         self._notifies = fnnotify.FnNotify()
@@ -336,11 +338,16 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
         self.searchLineEdit.setClearButtonEnabled(True)
         self.searchLineEdit.textChanged.connect(self.on_searchLineEdit_textChanged)
 
+        self.searchTimer = QtCore.QTimer(parent=self)
+        self.searchTimer.setObjectName('searchTimer')
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.setInterval(150)
+        self.searchTimer.timeout.connect(self.on_searchTimer_timeout)
+
         self.influenceTable = qinfluenceview.QInfluenceView()
         self.influenceTable.setObjectName('influenceTable')
         self.influenceTable.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding))
         self.influenceTable.setFocusPolicy(QtCore.Qt.ClickFocus)
-        self.influenceTable.setStyleSheet('QTableView::item { height: 24; text-align: center; }')
         self.influenceTable.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.influenceTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.influenceTable.setAlternatingRowColors(True)
@@ -350,14 +357,8 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
         self.influenceTable.clicked.connect(self.on_influenceTable_clicked)
         self.influenceTable.highlighted.connect(self.on_influenceTable_highlighted)
 
-        itemPrototype = QtGui.QStandardItem('')
-        itemPrototype.setSizeHint(QtCore.QSize(72, 24))
-        itemPrototype.setTextAlignment(QtCore.Qt.AlignCenter)
-
-        self.influenceItemModel = QtGui.QStandardItemModel(parent=self.influenceTable)
+        self.influenceItemModel = qinfluenceitemmodel.QInfluenceItemModel(parent=self.influenceTable)
         self.influenceItemModel.setObjectName('influenceItemModel')
-        self.influenceItemModel.setHorizontalHeaderLabels(['Name'])
-        self.influenceItemModel.setItemPrototype(itemPrototype)
 
         self.influenceItemFilterModel = qinfluenceitemfiltermodel.QInfluenceItemFilterModel(parent=self.influenceTable)
         self.influenceItemFilterModel.setObjectName('influenceItemFilterModel')
@@ -426,7 +427,6 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
         self.weightTable.setSizePolicy(QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding))
         self.weightTable.setFocusPolicy(QtCore.Qt.ClickFocus)
         self.weightTable.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
-        self.weightTable.setStyleSheet('QTableView::item { height: 24; text-align: center; }')
         self.weightTable.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.weightTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.weightTable.setAlternatingRowColors(True)
@@ -437,14 +437,8 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
         self.weightTable.doubleClicked.connect(self.on_weightTable_doubleClicked)
         self.weightTable.customContextMenuRequested.connect(self.on_weightTable_customContextMenuRequested)
 
-        itemPrototype = QtGui.QStandardItem('')
-        itemPrototype.setSizeHint(QtCore.QSize(72, 24))
-        itemPrototype.setTextAlignment(QtCore.Qt.AlignCenter)
-
-        self.weightItemModel = QtGui.QStandardItemModel(parent=self.weightTable)
+        self.weightItemModel = qweightitemmodel.QWeightItemModel(parent=self.weightTable)
         self.weightItemModel.setObjectName('weightItemModel')
-        self.weightItemModel.setHorizontalHeaderLabels(['Name', 'Weight'])
-        self.weightItemModel.setItemPrototype(itemPrototype)
 
         self.weightItemFilterModel = qinfluenceitemfiltermodel.QInfluenceItemFilterModel(parent=self.weightTable)
         self.weightItemFilterModel.setObjectName('weightItemFilterModel')
@@ -1059,6 +1053,7 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
 
         if self.skin.isValid():
 
+            self.invalidateInfluences()
             self.invalidateWeights()
     # endregion
 
@@ -1144,11 +1139,12 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
     def selection(self):
         """
         Returns the vertex indices from the active selection.
+        This list is cached by `invalidateSelection` so callers should not modify it!
 
         :rtype: List[int]
         """
 
-        return list(self._softSelection.keys())
+        return self._selection
 
     def softSelection(self):
         """
@@ -1210,17 +1206,15 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
         if self.precision:
 
             # Remove target influence if in source
+            # Be sure to copy the selected rows since the view caches this list!
             #
-            influenceIds = selectedRows
             currentInfluence = self.currentInfluence()
-
-            if currentInfluence in influenceIds:
-
-                influenceIds.remove(currentInfluence)
+            influenceIds = [x for x in selectedRows if x != currentInfluence]
 
         else:
 
-            influenceIds = [x for x in self.weightItemFilterModel.activeInfluences() if x not in selectedRows]
+            selectedIds = self.weightTable.selectedRowSet()
+            influenceIds = [x for x in self.weightItemFilterModel.activeInfluences() if x not in selectedIds]
 
         # Return influence ids
         #
@@ -1271,27 +1265,27 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
         self.skin.slabPasteWeights(self.selection(), mode=self.slabOption)
         self.invalidateWeights()
 
-    @contextGuard
-    def setWeights(self, amount):
+    def applyWeights(self, func, amount):
         """
-        Sets the selected vertex weights.
+        Passes the selected vertex weights through the supplied skin math function and applies the results.
+        The remaining arguments are resolved once up front so the loop only has to deal with the soft selection!
 
+        :type func: Callable
         :type amount: float
         :rtype: None
         """
 
-        # Iterate through selection
+        # Collect shared arguments
         #
         currentInfluence = self.currentInfluence()
         sourceInfluences = self.sourceInfluences()
         vertexWeights = self.vertexWeights()
         maxInfluences = self.skin.maxInfluences()
 
-        updates = {}
-
-        for (vertexIndex, falloff) in self._softSelection.items():
-
-            updates[vertexIndex] = skinmath.setWeights(
+        # Iterate through selection
+        #
+        updates = {
+            vertexIndex: func(
                 vertexWeights[vertexIndex],
                 currentInfluence,
                 sourceInfluences,
@@ -1299,6 +1293,18 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
                 falloff=falloff,
                 maxInfluences=maxInfluences
             )
+            for (vertexIndex, falloff) in self._softSelection.items()
+        }
+
+        # Discard any vertices that were left unchanged
+        # If nothing changed then there is no need to write to the skin or redraw!
+        #
+        updates = {vertexIndex: weights for (vertexIndex, weights) in updates.items() if weights != vertexWeights[vertexIndex]}
+
+        if len(updates) == 0:
+
+            log.debug('No weight changes detected...')
+            return
 
         # Assign updates to skin
         #
@@ -1306,38 +1312,26 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
         self.invalidateWeights()
 
     @contextGuard
-    def incrementWeights(self, amount):
+    def setWeights(self, amount):
         """
-        Increments the selected vertex weights.
+        Sets the selected vertex weights.
 
         :type amount: float
         :rtype: None
         """
 
-        # Iterate through selection
-        #
-        currentInfluence = self.currentInfluence()
-        sourceInfluences = self.sourceInfluences()
-        vertexWeights = self.vertexWeights()
-        maxInfluences = self.skin.maxInfluences()
-
-        updates = {}
+        self.applyWeights(skinmath.setWeights, amount)
 
-        for (vertexIndex, falloff) in self._softSelection.items():
+    @contextGuard
+    def incrementWeights(self, amount):
+        """
+        Increments the selected vertex weights.
 
-            updates[vertexIndex] = skinmath.incrementWeights(
-                vertexWeights[vertexIndex],
-                currentInfluence,
-                sourceInfluences,
-                amount,
-                falloff=falloff,
-                maxInfluences=maxInfluences
-            )
+        :type amount: float
+        :rtype: None
+        """
 
-        # Assign updates to skin
-        #
-        self.skin.applyVertexWeights(updates)
-        self.invalidateWeights()
+        self.applyWeights(skinmath.incrementWeights, amount)
 
     @contextGuard
     def scaleWeights(self, amount):
@@ -1348,30 +1342,7 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
         :rtype: None
         """
 
-        # Iterate through selection
-        #
-        currentInfluence = self.currentInfluence()
-        sourceInfluences = self.sourceInfluences()
-        vertexWeights = self.vertexWeights()
-        maxInfluences = self.skin.maxInfluences()
-
-        updates = {}
-
-        for (vertexIndex, falloff) in self._softSelection.items():
-
-            updates[vertexIndex] = skinmath.scaleWeights(
-                vertexWeights[vertexIndex],
-                currentInfluence,
-                sourceInfluences,
-                amount,
-                falloff=falloff,
-                maxInfluences=maxInfluences
-            )
-
-        # Assign updates to skin
-        #
-        self.skin.applyVertexWeights(updates)
-        self.invalidateWeights()
+        self.applyWeights(skinmath.scaleWeights, amount)
 
     def copySkin(self):
         """
@@ -1593,35 +1564,37 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
         :rtype: None
         """
 
-        # Resize item model
+        # Collect influence names
         #
         influences = self.skin.influences()
         maxInfluenceId = influences.lastIndex()
         rowCount = maxInfluenceId + 1
 
-        self.influenceItemModel.setVerticalHeaderLabels(list(map(str, range(rowCount))))
+        influenceNames = [''] * rowCount
 
-        # Iterate through influences
-        #
         for i in range(rowCount):
 
-            # Get influence name
-            #
             influence = influences[i]
-            influenceName = ''
 
             if influence is not None:
 
-                influenceName = influence.name()
+                influenceNames[i] = influence.name()
 
-            # Update item data
-            #
-            index = self.influenceItemModel.index(i, 0)
-            self.influenceItemModel.setData(index, influenceName, role=QtCore.Qt.DisplayRole)
-
-        # Invalidate filter model
+        # Update item models
+        # The weight model shares the same rows so both models reference the same names!
+        # The filter models react to the inserted, removed and renamed rows so there's no need to invalidate them!
+        # Table updates are suspended so both tables only repaint once all the models have changed!
         #
-        self.influenceItemFilterModel.invalidateFilter()
+        influenceNames = tuple(influenceNames)
+
+        self.influenceTable.setUpdatesEnabled(False)
+        self.weightTable.setUpdatesEnabled(False)
+
+        self.influenceItemModel.setNames(influenceNames)
+        self.weightItemModel.setNames(influenceNames)
+
+        self.weightTable.setUpdatesEnabled(True)
+        self.influenceTable.setUpdatesEnabled(True)
 
     @contextGuard
     def invalidateSelection(self):
@@ -1648,61 +1621,44 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
     def invalidateWeights(self, *args, **kwargs):
         """
         Invalidates the weight item model.
+        Influence names are managed by `invalidateInfluences` so only the weights are updated here!
 
         :rtype: None
         """
 
-        # Resize item model
+        # Get vertex weights
+        # If nothing has changed since the last invalidation then reuse the previous average!
         #
-        influences = self.skin.influences()
-        maxInfluenceId = influences.lastIndex()
-        rowCount = maxInfluenceId + 1
+        vertexWeights = self.skin.vertexWeights(*self._selection)
 
-        self.weightItemModel.setVerticalHeaderLabels(list(map(str, range(rowCount))))
+        if vertexWeights == self._vertexWeights:
 
-        # Get vertex weights
-        #
-        self._vertexWeights = self.skin.vertexWeights(*self._selection)
+            log.debug('Reusing averaged weights...')
 
-        if len(self._vertexWeights) > 0:
+        elif len(vertexWeights) > 0:
 
-            self._weights = skinmath.averageWeights(*list(self._vertexWeights.values()))
+            self._vertexWeights = vertexWeights
+            self._weights = skinmath.averageWeights(*list(vertexWeights.values()))
 
         else:
 
+            self._vertexWeights = vertexWeights
             self._weights = {}
 
-        # Iterate through influences
+        # Update item model and invalidate filter model
+        # The weight filter only hides unweighted rows so it's only re-run when the weighted rows have changed!
+        # Table updates are suspended so the weight table only repaints once filtering has completed!
         #
-        for i in range(maxInfluenceId + 1):
-
-            # Get influence name and weight
-            #
-            influence = influences[i]
-            influenceName = ''
-
-            if influence is not None:
-
-                influenceName = influence.name()
+        self.weightTable.setUpdatesEnabled(False)
 
-            weight = self._weights.get(i, None)
-            influenceWeight = ''
+        nullRows = self.weightItemModel.nullRows()
+        self.weightItemModel.setWeights(self._weights)
 
-            if isinstance(weight, (int, float)):
+        if self.weightItemModel.nullRows() != nullRows:
 
-                influenceWeight = str(round(weight, 2))
+            self.weightItemFilterModel.invalidateFilter()
 
-            # Update item data
-            #
-            index = self.weightItemModel.index(i, 0)
-            self.weightItemModel.setData(index, influenceName, role=QtCore.Qt.DisplayRole)
-
-            index = self.weightItemModel.index(i, 1)
-            self.weightItemModel.setData(index, influenceWeight, role=QtCore.Qt.DisplayRole)
-
-        # Invalidate filter model
-        #
-        self.weightItemFilterModel.invalidateFilter()
+        self.weightTable.setUpdatesEnabled(True)
         self.invalidateColors()
 
     @contextGuard
@@ -1784,8 +1740,11 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
 
             # Reset item models
             #
-            self.influenceItemModel.setRowCount(0)
-            self.weightItemModel.setRowCount(0)
+            self._currentInfluence = None
+
+            self.influenceItemModel.setNames(())
+            self.weightItemModel.setNames(())
+            self.weightItemModel.setWeights({})
 
             # Disable precision mode
             #
@@ -2165,11 +2124,48 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
         :rtype: None
         """
 
-        text = self.sender().text()
-        filterWildcard = '*{text}*'.format(text=text)
+        # Store search string and restart timer
+        # This coalesces rapid keystrokes into a single filter pass!
+        #
+        self._search = self.sender().text()
+        self.searchTimer.start()
+
+    @QtCore.Slot()
+    def on_searchTimer_timeout(self):
+        """
+        Slot method for the `searchTimer` widget's `timeout` signal.
+
+        :rtype: None
+        """
+
+        # Check if search has changed
+        #
+        if self._search == self._lastSearch:
+
+            return
+
+        # Check if search is empty
+        # An empty pattern lets the filter model skip regex matching altogether!
+        #
+        self._lastSearch = self._search
+
+        if not self._search:
+
+            log.info('Clearing search...')
+            self._searchRegex = QtCore.QRegularExpression()
+
+            self.influenceItemFilterModel.setFilterRegularExpression(self._searchRegex)
+            return
+
+        # Compile wildcard pattern once per search string
+        #
+        filterWildcard = '*{text}*'.format(text=self._search)
+        pattern = QtCore.QRegularExpression.wildcardToRegularExpression(filterWildcard)
+
+        self._searchRegex = QtCore.QRegularExpression(pattern, QtCore.QRegularExpression.CaseInsensitiveOption)
 
         log.info(f'Searching for: {filterWildcard}')
-        self.influenceItemFilterModel.setFilterWildcard(filterWildcard)
+        self.influenceItemFilterModel.setFilterRegularExpression(self._searchRegex)
 
     @QtCore.Slot(bool)
     def on_addInfluencePushButton_clicked(self, checked=False):
@@ -2233,6 +2229,14 @@ class QSkinBlender(qsingletonwindow.QSingletonWindow):
 
         if numRows == 1:
 
+            # Check if current influence has changed
+            # If not, then there is no need to rebake the vertex colors!
+            #
+            if rows[0] == self._currentInfluence:
+
+                log.debug('No influence changes detected...')
+                return
+
             # Update current influence
             #
             self._currentInfluence = rows[0]
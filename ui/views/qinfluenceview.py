@@ -36,6 +36,7 @@ class QInfluenceView(QtWidgets.QTableView):
         self._autoSelect = True
         self._pending = False
         self._selectedRows = []
+        self._selectedRowSet = frozenset()
 
         # Enable view grid
         #
@@ -238,6 +239,16 @@ class QInfluenceView(QtWidgets.QTableView):
 
         return self._selectedRows
 
+    def selectedRowSet(self):
+        """
+        Returns the selected rows as a set.
+        This is used by the filter models since they test membership for every row!
+
+        :rtype: FrozenSet[int]
+        """
+
+        return self._selectedRowSet
+
     def selectRow(self, row):
         """
         Selects the specified row.
@@ -359,7 +370,8 @@ class QInfluenceView(QtWidgets.QTableView):
 
             selection = model.mapSelectionToSource(selection)
 
-        self._selectedRows = list({index.row() for index in selection.indexes()})
+        self._selectedRowSet = frozenset(index.row() for index in selection.indexes())
+        self._selectedRows = list(self._selectedRowSet)
         log.debug(f'"{self.objectName()}" selection changed: {self._selectedRows}')
 
         # Emit highlighted signal